@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import dataclass
 from functools import wraps
 import logging
 from typing import Any, Concatenate
@@ -15,15 +16,54 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers import aiohttp_client, device_registry as dr
+from homeassistant.helpers import (
+    aiohttp_client,
+    config_validation as cv,
+    device_registry as dr,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-
-from .const import DOMAIN, PLATFORM_LOOKUP, PLATFORMS
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    CONF_LOCAL_PAIRING,
+    CONF_LOCAL_READ,
+    DOMAIN,
+    PLATFORM_LOOKUP,
+    PLATFORMS,
+)
 from .entity import HiveEntity
+from .local import HiveLocalReader
+from .profiling import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
-type HiveConfigEntry = ConfigEntry[Hive]
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+type HiveConfigEntry = ConfigEntry[HiveRuntimeData]
+
+
+@dataclass
+class HiveRuntimeData:
+    """Hive session and optional local hub reader for a config entry."""
+
+    hive: Hive
+    local: HiveLocalReader | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate to the Hive session.
+
+        The platforms re-exported from Home Assistant use runtime_data as
+        the Hive object itself.
+        """
+        if name.startswith("__") or name == "hive":
+            raise AttributeError(name)
+        return getattr(self.hive, name)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Hive integration services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: HiveConfigEntry) -> bool:
@@ -36,7 +76,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: HiveConfigEntry) -> bool
     hive_config["options"].update(
         {CONF_SCAN_INTERVAL: dict(entry.options).get(CONF_SCAN_INTERVAL, 120)}
     )
-    entry.runtime_data = hive
+    local = None
+    if entry.options.get(CONF_LOCAL_READ) and CONF_LOCAL_PAIRING in entry.data:
+        local = HiveLocalReader(hass, entry.data[CONF_LOCAL_PAIRING])
+        entry.async_on_unload(local.async_stop)
+    entry.runtime_data = HiveRuntimeData(hive, local)
 
     try:
         devices = await hive.session.startSession(hive_config)
@@ -64,10 +108,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: HiveConfigEntry) -> bool
             if devices.get(hive_type)
         ],
     )
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: HiveConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: HiveConfigEntry) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
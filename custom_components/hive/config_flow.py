@@ -21,8 +21,15 @@ from homeassistant.config_entries import (
     ConfigFlowResult,
     OptionsFlow,
 )
-from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_PIN,
+    CONF_SCAN_INTERVAL,
+    CONF_USERNAME,
+)
 from homeassistant.core import callback
+import homeassistant.helpers.config_validation as cv
 import logging
 
 from . import HiveConfigEntry
@@ -30,9 +37,16 @@ from .const import (
     CONF_CODE,
     CONF_DEVICE_NAME,
     CONF_DISABLE_2FA_DEBUG,
+    CONF_EXCLUDED_SENSOR_TYPES,
+    CONF_LOCAL_PAIRING,
+    CONF_LOCAL_READ,
+    CONF_LOCAL_UPDATE_PAIRING,
+    CONF_SENSOR_TYPES,
     CONFIG_ENTRY_VERSION,
     DOMAIN,
 )
+from .local import HiveLocalError, HiveLocalInvalidPin, async_pair, update_host
+from .sensor import SENSOR_HIVE_TYPES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -223,10 +237,11 @@ class HiveFlowHandler(ConfigFlow, domain=DOMAIN):
 
         self.data["tokens"] = self.tokens
         if self.source == SOURCE_REAUTH:
+            # Merge so the HomeKit pairing for local reads survives reauth.
             return self.async_update_reload_and_abort(
                 self._get_reauth_entry(),
                 title=self.data["username"],
-                data=self.data,
+                data_updates=self.data,
                 reason="reauth_successful",
             )
         return self.async_create_entry(title=self.data["username"], data=self.data)
@@ -259,6 +274,12 @@ class HiveOptionsFlowHandler(OptionsFlow):
         """Initialize Hive options flow."""
         self.hive = None
         self.interval = config_entry.options.get(CONF_SCAN_INTERVAL, 120)
+        excluded_types = config_entry.options.get(CONF_EXCLUDED_SENSOR_TYPES, [])
+        self.sensor_types = [
+            key for key in SENSOR_HIVE_TYPES if key not in excluded_types
+        ]
+        self.local_read = config_entry.options.get(CONF_LOCAL_READ, False)
+        self.options: dict[str, Any] = {}
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -270,23 +291,79 @@ class HiveOptionsFlowHandler(OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle a flow initialized by the user."""
-        self.hive = self.config_entry.runtime_data
+        self.hive = self.config_entry.runtime_data.hive
         errors: dict[str, str] = {}
         if user_input is not None:
             new_interval = user_input.get(CONF_SCAN_INTERVAL)
             assert self.hive
             await self.hive.updateInterval(new_interval)
+            update_pairing = user_input.pop(CONF_LOCAL_UPDATE_PAIRING, False)
+            sensor_types = user_input.pop(CONF_SENSOR_TYPES, SENSOR_HIVE_TYPES)
+            user_input[CONF_EXCLUDED_SENSOR_TYPES] = [
+                key for key in SENSOR_HIVE_TYPES if key not in sensor_types
+            ]
+            if user_input.get(CONF_LOCAL_READ) and (
+                update_pairing or CONF_LOCAL_PAIRING not in self.config_entry.data
+            ):
+                self.options = user_input
+                return await self.async_step_local_pairing()
             return self.async_create_entry(title="", data=user_input)
 
         schema = vol.Schema(
             {
                 vol.Optional(CONF_SCAN_INTERVAL, default=self.interval): vol.All(
                     vol.Coerce(int), vol.Range(min=30)
-                )
+                ),
+                vol.Optional(
+                    CONF_SENSOR_TYPES, default=self.sensor_types
+                ): cv.multi_select({key: key for key in SENSOR_HIVE_TYPES}),
+                vol.Optional(CONF_LOCAL_READ, default=self.local_read): bool,
+                vol.Optional(CONF_LOCAL_UPDATE_PAIRING, default=False): bool,
             }
         )
         return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
 
+    async def async_step_local_pairing(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Pair with the Hive hub's HomeKit interface for local reads."""
+        errors: dict[str, str] = {}
+        pairing_data = self.config_entry.data.get(CONF_LOCAL_PAIRING)
+        if user_input is not None:
+            host = user_input[CONF_HOST]
+            pin = user_input.get(CONF_PIN)
+            try:
+                if pin:
+                    pairing_data = await async_pair(self.hass, host, pin)
+                elif pairing_data:
+                    pairing_data = update_host(pairing_data, host)
+                else:
+                    raise HiveLocalInvalidPin("A HomeKit setup code is required")
+            except HiveLocalInvalidPin:
+                errors["base"] = "local_invalid_pin"
+            except HiveLocalError as err:
+                _LOGGER.warning("Pairing with the Hive hub failed: %s", err)
+                errors["base"] = "local_pairing_failed"
+            else:
+                # Update data and options together so the entry reloads once.
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry,
+                    data={**self.config_entry.data, CONF_LOCAL_PAIRING: pairing_data},
+                    options=self.options,
+                )
+                return self.async_create_entry(title="", data=self.options)
+
+        host = (pairing_data or {}).get("AccessoryIP", "")
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_HOST, default=host): str,
+                vol.Optional(CONF_PIN): str,
+            }
+        )
+        return self.async_show_form(
+            step_id="local_pairing", data_schema=schema, errors=errors
+        )
+
 
 class UnknownHiveError(Exception):
     """Catch unknown hive error."""
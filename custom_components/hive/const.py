@@ -1,12 +1,18 @@
 """Constants for Hive."""
 from homeassistant.const import Platform
 
+ATTR_DURATION = "duration"
 ATTR_MODE = "mode"
 ATTR_TIME_PERIOD = "time_period"
 ATTR_ONOFF = "on_off"
 CONF_CODE = "2fa"
 CONF_DEVICE_NAME = "device_name"
 CONF_DISABLE_2FA_DEBUG = "disable_2fa_debug"
+CONF_EXCLUDED_SENSOR_TYPES = "excluded_sensor_types"
+CONF_LOCAL_PAIRING = "local_pairing"
+CONF_LOCAL_READ = "local_read"
+CONF_LOCAL_UPDATE_PAIRING = "local_update_pairing"
+CONF_SENSOR_TYPES = "sensor_types"
 CONFIG_ENTRY_VERSION = 1
 DEFAULT_NAME = "Hive"
 DOMAIN = "hive"
@@ -29,4 +35,6 @@ PLATFORM_LOOKUP = {
 SERVICE_BOOST_HOT_WATER = "boost_hot_water"
 SERVICE_BOOST_HEATING_ON = "boost_heating_on"
 SERVICE_BOOST_HEATING_OFF = "boost_heating_off"
+SERVICE_PROFILE_START = "profile_start"
+SERVICE_PROFILE_STOP = "profile_stop"
 WATER_HEATER_MODES = ["on", "off"]
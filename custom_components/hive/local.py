@@ -0,0 +1,255 @@
+"""Local LAN reads from the Hive hub through its HomeKit interface."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+import re
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+
+if TYPE_CHECKING:
+    from aiohomekit import Controller
+
+_LOGGER = logging.getLogger(__name__)
+
+LOCAL_ALIAS = "hive"
+LOCAL_BACKOFF_MAX = 600
+LOCAL_BACKOFF_MIN = 30
+LOCAL_DISCOVERY_TIMEOUT = 10
+LOCAL_READ_TIMEOUT = 5
+LOCAL_REFRESH_INTERVAL = 5
+PIN_FORMAT = re.compile(r"^(\d{3})-?(\d{2})-?(\d{3})$")
+
+# Hive sensor types that can be read locally, and the HomeKit service and
+# characteristic (aiohomekit ServicesTypes / CharacteristicsTypes names)
+# that provide them.
+LOCAL_CHARACTERISTICS = {
+    "Heating_Current_Temperature": ("THERMOSTAT", "TEMPERATURE_CURRENT"),
+    "Heating_Target_Temperature": ("THERMOSTAT", "TEMPERATURE_TARGET"),
+    "Heating_State": ("THERMOSTAT", "HEATING_COOLING_CURRENT"),
+    "Hotwater_State": ("SWITCH", "ON"),
+}
+LOCAL_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "Heating_State": lambda value: "ON" if value else "OFF",
+    "Hotwater_State": lambda value: "ON" if value else "OFF",
+}
+
+
+class HiveLocalError(Exception):
+    """Catch local hive error."""
+
+
+class HiveLocalInvalidPin(HiveLocalError):
+    """Catch invalid HomeKit setup code."""
+
+
+def format_pin(pin: str) -> str:
+    """Return pin in the XXX-XX-XXX form HomeKit expects."""
+    if not (match := PIN_FORMAT.match(pin.strip())):
+        raise HiveLocalInvalidPin(f"Invalid HomeKit setup code {pin}")
+    return "-".join(match.groups())
+
+
+def update_host(pairing_data: dict[str, Any], host: str) -> dict[str, Any]:
+    """Return pairing_data pointing at the hub's new address."""
+    return {**pairing_data, "AccessoryIP": host, "AccessoryIPs": [host]}
+
+
+async def _async_get_controller(hass: HomeAssistant) -> Controller:
+    """Return a started HomeKit controller."""
+    # pylint: disable-next=import-outside-toplevel
+    from aiohomekit import Controller
+    from aiohomekit.characteristic_cache import CharacteristicCacheMemory
+
+    from homeassistant.components import zeroconf
+
+    controller = Controller(
+        async_zeroconf_instance=await zeroconf.async_get_async_instance(hass),
+        char_cache=CharacteristicCacheMemory(),
+    )
+    await controller.async_start()
+    return controller
+
+
+async def _async_load_pairing(
+    hass: HomeAssistant, pairing_data: dict[str, Any]
+) -> tuple[Controller, Any]:
+    """Return a controller and the pairing loaded from pairing_data."""
+    controller = await _async_get_controller(hass)
+    try:
+        return controller, controller.load_pairing(LOCAL_ALIAS, pairing_data)
+    except BaseException:
+        await controller.async_stop()
+        raise
+
+
+async def async_pair(hass: HomeAssistant, host: str, pin: str) -> dict[str, Any]:
+    """Pair with the Hive hub at host and return the pairing data."""
+    # pylint: disable-next=import-outside-toplevel
+    from aiohomekit.exceptions import HomeKitException
+
+    pin = format_pin(pin)
+    controller = await _async_get_controller(hass)
+    try:
+        async for discovery in controller.async_discover(LOCAL_DISCOVERY_TIMEOUT):
+            if host in (discovery.description.address, discovery.description.name):
+                break
+        else:
+            raise HiveLocalError(f"No HomeKit accessory found at {host}")
+
+        finish_pairing = await discovery.async_start_pairing(LOCAL_ALIAS)
+        pairing = await finish_pairing(pin)
+        pairing_data = dict(pairing.pairing_data)
+        await pairing.close()
+    except (HomeKitException, OSError) as err:
+        raise HiveLocalError(str(err)) from err
+    finally:
+        await controller.async_stop()
+    return pairing_data
+
+
+class HiveLocalReader:
+    """Read Hive sensor states from the hub over the LAN."""
+
+    def __init__(self, hass: HomeAssistant, pairing_data: dict[str, Any]) -> None:
+        """Initialise the local reader."""
+        self.hass = hass
+        self._pairing_data = pairing_data
+        self._controller: Controller | None = None
+        self._pairing: Any = None
+        # (service type, characteristic type) -> name -> (aid, iid)
+        self._characteristics: dict[tuple[str, str], dict[str, tuple[int, int]]] = {}
+        self._values: dict[tuple[int, int], Any] = {}
+        self._updated = 0.0
+        self._failures = 0
+        self._retry_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def async_get_state(self, device: dict[str, Any]) -> Any | None:
+        """Return the local state of a Hive sensor, or None to use the cloud."""
+        # pylint: disable-next=import-outside-toplevel
+        from aiohomekit.exceptions import HomeKitException
+
+        hive_type = device["hiveType"]
+        if hive_type not in LOCAL_CHARACTERISTICS or monotonic() < self._retry_at:
+            return None
+
+        async with self._lock:
+            # Readers queued behind a failed refresh use the cloud rather
+            # than each retrying the hub.
+            if monotonic() < self._retry_at:
+                return None
+            try:
+                await self._async_refresh()
+            except (HomeKitException, OSError, TimeoutError) as err:
+                _LOGGER.debug("Local Hive read failed: %s", err)
+                await self._async_back_off()
+                return None
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Unexpected error reading from the Hive hub")
+                await self._async_back_off()
+                return None
+            self._failures = 0
+
+        by_name = self._characteristics.get(_local_types(hive_type), {})
+        aid_iid = by_name.get(device["hiveName"].lower())
+        if aid_iid is None or (value := self._values.get(aid_iid)) is None:
+            return None
+        return LOCAL_CONVERTERS.get(hive_type, lambda value: value)(value)
+
+    async def async_stop(self) -> None:
+        """Close the connection to the hub."""
+        pairing, self._pairing = self._pairing, None
+        controller, self._controller = self._controller, None
+        self._characteristics = {}
+        self._values = {}
+        self._updated = 0.0
+        try:
+            if pairing is not None:
+                await pairing.close()
+        finally:
+            if controller is not None:
+                await controller.async_stop()
+
+    async def _async_back_off(self) -> None:
+        """Use the cloud for a while after a failed refresh."""
+        self._failures += 1
+        backoff = min(LOCAL_BACKOFF_MIN * 2 ** (self._failures - 1), LOCAL_BACKOFF_MAX)
+        self._retry_at = monotonic() + backoff
+        _LOGGER.debug("Using the cloud for Hive reads for %ss", backoff)
+        try:
+            await self.async_stop()
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("Error closing the Hive hub connection", exc_info=True)
+
+    async def _async_connect(self) -> None:
+        """Load the pairing and map the hub's characteristics."""
+        # pylint: disable-next=import-outside-toplevel
+        from aiohomekit.model import Accessories
+        from aiohomekit.model.characteristics import CharacteristicsTypes
+        from aiohomekit.model.services import ServicesTypes
+
+        async with asyncio.timeout(LOCAL_READ_TIMEOUT):
+            self._controller, self._pairing = await _async_load_pairing(
+                self.hass, self._pairing_data
+            )
+            accessories = Accessories.from_list(
+                await self._pairing.list_accessories_and_characteristics()
+            )
+
+        wanted = {_local_types(hive_type) for hive_type in LOCAL_CHARACTERISTICS}
+        for accessory in accessories:
+            info = accessory.services.first(
+                service_type=ServicesTypes.ACCESSORY_INFORMATION
+            )
+            accessory_names = set()
+            if info is not None:
+                accessory_name = info.value(CharacteristicsTypes.NAME, "")
+                accessory_names.add(str(accessory_name).lower())
+            for service in accessory.services:
+                names = set(accessory_names)
+                if service.has(CharacteristicsTypes.NAME):
+                    names.add(str(service.value(CharacteristicsTypes.NAME)).lower())
+                for char in service.characteristics:
+                    if (key := (service.type, char.type)) not in wanted:
+                        continue
+                    by_name = self._characteristics.setdefault(key, {})
+                    for name in names:
+                        by_name[name] = (accessory.aid, char.iid)
+
+    async def _async_refresh(self) -> None:
+        """Read all mapped characteristics in one request when stale."""
+        if monotonic() - self._updated < LOCAL_REFRESH_INTERVAL:
+            return
+        if self._pairing is None:
+            await self._async_connect()
+
+        aid_iids = {
+            aid_iid
+            for by_name in self._characteristics.values()
+            for aid_iid in by_name.values()
+        }
+        if aid_iids:
+            async with asyncio.timeout(LOCAL_READ_TIMEOUT):
+                values = await self._pairing.get_characteristics(sorted(aid_iids))
+            self._values = {
+                aid_iid: value.get("value") for aid_iid, value in values.items()
+            }
+        self._updated = monotonic()
+
+
+def _local_types(hive_type: str) -> tuple[str, str]:
+    """Return the HomeKit service and characteristic types for a hiveType."""
+    # pylint: disable-next=import-outside-toplevel
+    from aiohomekit.model.characteristics import CharacteristicsTypes
+    from aiohomekit.model.services import ServicesTypes
+
+    service, characteristic = LOCAL_CHARACTERISTICS[hive_type]
+    return (
+        getattr(ServicesTypes, service),
+        getattr(CharacteristicsTypes, characteristic),
+    )
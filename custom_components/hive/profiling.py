@@ -0,0 +1,262 @@
+"""On-demand profiling of the Hive integration hot paths."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import wraps
+import inspect
+import logging
+from time import perf_counter, thread_time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_DURATION,
+    DOMAIN,
+    SERVICE_PROFILE_START,
+    SERVICE_PROFILE_STOP,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_DURATION = 60
+PROFILE_START_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=3600)
+        )
+    }
+)
+
+# Hive library objects whose coroutine methods are timed while profiling.
+HIVE_PROFILE_OBJECTS = ("session", "session.api", "sensor", "heating", "hotwater")
+SENSOR_PROFILE_METHODS = (
+    "async_update",
+    "async_hydrate_attributes",
+    "async_update_attributes",
+    "get_current_temp_sa",
+    "get_heating_boost_sa",
+    "get_heating_state_sa",
+    "get_hotwater_boost_sa",
+    "get_hotwater_state_sa",
+)
+
+
+@dataclass
+class ProfileStat:
+    """Timings collected for a single profiled coroutine."""
+
+    calls: int = 0
+    wall: float = 0.0
+    on_loop: float = 0.0
+    cpu: float = 0.0
+    max_wall: float = 0.0
+
+    @property
+    def blocked(self) -> float:
+        """Return the time spent on the loop without using the CPU."""
+        return max(self.on_loop - self.cpu, 0.0)
+
+    @property
+    def awaiting(self) -> float:
+        """Return the time spent suspended waiting on I/O."""
+        return max(self.wall - self.on_loop, 0.0)
+
+
+class _TimedCoroutine:
+    """Drive a coroutine and split its wall time into CPU, blocked and awaiting."""
+
+    def __init__(self, coro: Coroutine[Any, Any, Any], stat: ProfileStat) -> None:
+        """Initialise the timed coroutine."""
+        self._coro = coro
+        self._stat = stat
+
+    def __await__(self):
+        """Step the wrapped coroutine, timing each step it runs for."""
+        coro = self._coro
+        on_loop = 0.0
+        cpu = 0.0
+        start = perf_counter()
+        value: Any = None
+        error: BaseException | None = None
+        try:
+            while True:
+                step = perf_counter()
+                step_cpu = thread_time()
+                try:
+                    if error is not None:
+                        yielded = coro.throw(error)
+                    else:
+                        yielded = coro.send(value)
+                except StopIteration as stop:
+                    return stop.value
+                finally:
+                    on_loop += perf_counter() - step
+                    cpu += thread_time() - step_cpu
+                try:
+                    value = yield yielded
+                    error = None
+                except BaseException as err:  # noqa: BLE001
+                    value = None
+                    error = err
+        finally:
+            wall = perf_counter() - start
+            self._stat.calls += 1
+            self._stat.wall += wall
+            self._stat.on_loop += on_loop
+            self._stat.cpu += cpu
+            self._stat.max_wall = max(self._stat.max_wall, wall)
+
+
+class HiveProfiler:
+    """Time-limited profiler for the Hive integration coroutines."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise the profiler."""
+        self.hass = hass
+        self.stats: dict[str, ProfileStat] = {}
+        self.started: float | None = None
+        self._restore: list[Callable[[], None]] = []
+        self._cancel_stop: CALLBACK_TYPE | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return if a profile is being captured."""
+        return self.started is not None
+
+    @callback
+    def async_start(self, duration: int) -> None:
+        """Instrument the integration and start capturing."""
+        if self.running:
+            raise HomeAssistantError("A Hive profile is already running")
+
+        # Imported here so the platform is only loaded once it is in use.
+        from .sensor import HiveSensorEntity  # pylint: disable=import-outside-toplevel
+
+        self.stats = {}
+        for name in SENSOR_PROFILE_METHODS:
+            self._instrument(HiveSensorEntity, name, f"sensor.{name}")
+
+        for entry in self.hass.config_entries.async_entries(DOMAIN):
+            if entry.state is not ConfigEntryState.LOADED:
+                continue
+            for path in HIVE_PROFILE_OBJECTS:
+                target: Any = entry.runtime_data.hive
+                for attr in path.split("."):
+                    target = getattr(target, attr, None)
+                if target is None:
+                    continue
+                for name in dir(type(target)):
+                    if name.startswith("_"):
+                        continue
+                    if inspect.iscoroutinefunction(getattr(type(target), name)):
+                        self._instrument(target, name, f"apyhiveapi.{path}.{name}")
+            if local := entry.runtime_data.local:
+                self._instrument(local, "async_get_state", "local.async_get_state")
+
+        self.started = perf_counter()
+        self._cancel_stop = async_call_later(
+            self.hass, timedelta(seconds=duration), self._async_timeout
+        )
+        _LOGGER.info("Hive profiling started for %s seconds", duration)
+
+    async def async_stop(self) -> str:
+        """Stop capturing, restore the integration and write the stats file."""
+        if not self.running:
+            raise HomeAssistantError("No Hive profile is running")
+
+        if self._cancel_stop is not None:
+            self._cancel_stop()
+            self._cancel_stop = None
+        while self._restore:
+            self._restore.pop()()
+
+        assert self.started is not None
+        elapsed = perf_counter() - self.started
+        self.started = None
+        stats, self.stats = self.stats, {}
+
+        path = self.hass.config.path(
+            f"hive_profile_{dt_util.utcnow().strftime('%Y%m%d_%H%M%S')}.txt"
+        )
+        await self.hass.async_add_executor_job(_write_stats, path, stats, elapsed)
+        _LOGGER.info("Hive profile written to %s", path)
+        return path
+
+    async def _async_timeout(self, _now: Any) -> None:
+        """Stop the profile once its duration has elapsed."""
+        self._cancel_stop = None
+        if self.running:
+            await self.async_stop()
+
+    def _instrument(self, owner: Any, name: str, label: str) -> None:
+        """Wrap a coroutine method so each call is timed under label."""
+        original = owner.__dict__.get(name)
+        method = getattr(owner, name)
+        stat = self.stats.setdefault(label, ProfileStat())
+
+        @wraps(method)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await _TimedCoroutine(method(*args, **kwargs), stat)
+
+        setattr(owner, name, wrapper)
+
+        def restore() -> None:
+            if original is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+
+        self._restore.append(restore)
+
+
+def _write_stats(path: str, stats: dict[str, ProfileStat], elapsed: float) -> None:
+    """Write the collected stats, slowest first, to path."""
+    lines = [
+        f"Hive profile captured over {elapsed:.1f}s",
+        "Times are cumulative seconds and include nested profiled calls.",
+        "wall = cpu + blocked + awaiting. cpu is event loop thread CPU time,",
+        "blocked is time on the loop without CPU (blocking calls, GIL waits)",
+        "and awaiting is time suspended waiting on I/O.",
+        "",
+        f"{'calls':>7} {'wall':>10} {'cpu':>10} {'blocked':>10} {'awaiting':>10} "
+        f"{'max':>10}  name",
+    ]
+    lines.extend(
+        f"{stat.calls:>7} {stat.wall:>10.4f} {stat.cpu:>10.4f} "
+        f"{stat.blocked:>10.4f} {stat.awaiting:>10.4f} {stat.max_wall:>10.4f}  {label}"
+        for label, stat in sorted(
+            stats.items(), key=lambda item: item[1].wall, reverse=True
+        )
+        if stat.calls
+    )
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines) + "\n")
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Hive profiling services."""
+    profiler = HiveProfiler(hass)
+
+    async def async_profile_start(call: ServiceCall) -> None:
+        """Start a time-limited profile."""
+        profiler.async_start(call.data[ATTR_DURATION])
+
+    async def async_profile_stop(call: ServiceCall) -> None:
+        """Stop the running profile and write its stats."""
+        await profiler.async_stop()
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE_START, async_profile_start, PROFILE_START_SCHEMA
+    )
+    hass.services.async_register(DOMAIN, SERVICE_PROFILE_STOP, async_profile_stop)
@@ -1,8 +1,11 @@
 """Support for the Hive sensors."""
 
+import asyncio
 from datetime import timedelta
+import logging
 
 from homeassistant.components.sensor import (
+    DOMAIN as SENSOR_DOMAIN,
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
@@ -14,14 +17,30 @@ from homeassistant.const import (
     UnitOfPower,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.start import async_at_started
 
 from . import HiveConfigEntry
+from .const import CONF_EXCLUDED_SENSOR_TYPES, DOMAIN
 from .entity import HiveEntity
 
+_LOGGER = logging.getLogger(__name__)
+
 PARALLEL_UPDATES = 0
 SCAN_INTERVAL = timedelta(seconds=15)
+ATTRIBUTE_HYDRATION_INTERVAL = timedelta(seconds=2)
+# Sensor hiveTypes with state attributes and the method that builds them.
+ATTRIBUTE_BUILDERS = {
+    "Heating_Current_Temperature": "get_current_temp_sa",
+    "Heating_State": "get_heating_state_sa",
+    "Heating_Mode": "get_heating_state_sa",
+    "Heating_Boost": "get_heating_boost_sa",
+    "Hotwater_State": "get_hotwater_state_sa",
+    "Hotwater_Mode": "get_hotwater_state_sa",
+    "Hotwater_Boost": "get_hotwater_boost_sa",
+}
 
 SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
     SensorEntityDescription(
@@ -29,6 +48,7 @@ SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         device_class=SensorDeviceClass.BATTERY,
         entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
     ),
     SensorEntityDescription(
         key="Power",
@@ -36,6 +56,7 @@ SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.POWER,
         entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
     ),
     SensorEntityDescription(
         key="Heating_Current_Temperature",
@@ -78,9 +99,17 @@ SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
     SensorEntityDescription(
         key="Mode",
         icon="mdi:eye",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key="Availability",
+        icon="mdi:check-circle",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
     ),
-    SensorEntityDescription(key="Availability", icon="mdi:check-circle"),
 )
+SENSOR_HIVE_TYPES = [description.key for description in SENSOR_TYPES]
 
 
 async def async_setup_entry(
@@ -89,56 +118,155 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up Hive thermostat based on a config entry."""
-    hive = entry.runtime_data
+    hive = entry.runtime_data.hive
+    # Excluded rather than selected types are stored so sensor types added in
+    # later releases are created without the user revisiting the options.
+    excluded_types = entry.options.get(CONF_EXCLUDED_SENSOR_TYPES, [])
+
+    # Drop registry entries for sensor types that are no longer created.
+    entity_registry = er.async_get(hass)
+    for entity_entry in er.async_entries_for_config_entry(
+        entity_registry, entry.entry_id
+    ):
+        if (
+            entity_entry.domain == SENSOR_DOMAIN
+            and entity_entry.unique_id.rsplit("-", 1)[-1] in excluded_types
+        ):
+            entity_registry.async_remove(entity_entry.entity_id)
+
     devices = hive.session.deviceList.get("sensor")
     if not devices:
         return
-    async_add_entities(
-        (
-            HiveSensorEntity(hive, dev, description)
-            for dev in devices
-            for description in SENSOR_TYPES
-            if dev["hiveType"] == description.key
-        ),
-        True,
+    local = entry.runtime_data.local
+    hydrator = AttributeHydrator(hass, entry)
+    entities = [
+        HiveSensorEntity(hive, dev, description, hydrator, local)
+        for dev in devices
+        for description in SENSOR_TYPES
+        if dev["hiveType"] == description.key and description.key not in excluded_types
+    ]
+
+    # Disabled entities are still added so they stay in the entity registry,
+    # but without an update so they never fetch from Hive.
+    enabled = []
+    disabled = []
+    for entity in entities:
+        if _entity_disabled(hass, entry, entity):
+            disabled.append(entity)
+        else:
+            enabled.append(entity)
+    async_add_entities(enabled, True)
+    async_add_entities(disabled)
+
+
+def _entity_disabled(
+    hass: HomeAssistant, entry: HiveConfigEntry, entity: SensorEntity
+) -> bool:
+    """Return if the entity is, or will be registered as, disabled."""
+    entity_registry = er.async_get(hass)
+    if entity_id := entity_registry.async_get_entity_id(
+        SENSOR_DOMAIN, DOMAIN, entity.unique_id
+    ):
+        return entity_registry.async_get(entity_id).disabled
+
+    # Mirror how the entity platform disables entities it registers.
+    if not entity.entity_registry_enabled_default or entry.pref_disable_new_entities:
+        return True
+    if (device_info := entity.device_info) is None:
+        return False
+    device = dr.async_get(hass).async_get_device(
+        identifiers=device_info["identifiers"]
     )
+    return device is not None and device.disabled
+
+
+class AttributeHydrator:
+    """Build deferred sensor attributes at a limited rate once HA has started."""
+
+    def __init__(self, hass: HomeAssistant, entry: HiveConfigEntry) -> None:
+        """Initialise the hydrator and start it once HA has started."""
+        self.hass = hass
+        self._entry = entry
+        self._pending: list[HiveSensorEntity] = []
+        self._started = False
+        self._task: asyncio.Task | None = None
+        entry.async_on_unload(async_at_started(hass, self._async_start))
+
+    @callback
+    def async_add(self, entity: "HiveSensorEntity") -> CALLBACK_TYPE:
+        """Queue an entity for hydration and return a callback to dequeue it."""
+        self._pending.append(entity)
+        self._async_schedule()
+
+        @callback
+        def async_remove() -> None:
+            if entity in self._pending:
+                self._pending.remove(entity)
+
+        return async_remove
+
+    @callback
+    def _async_start(self, hass: HomeAssistant) -> None:
+        """Allow hydration now that HA has started."""
+        self._started = True
+        self._async_schedule()
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Drain the queue in the background unless already doing so."""
+        if not self._started or not self._pending:
+            return
+        if self._task is None or self._task.done():
+            self._task = self._entry.async_create_background_task(
+                self.hass, self._async_run(), "hive_sensor_attribute_hydration"
+            )
+
+    async def _async_run(self) -> None:
+        """Hydrate queued entities one at a time."""
+        while self._pending:
+            entity = self._pending.pop(0)
+            try:
+                await entity.async_hydrate_attributes()
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Error building attributes for %s", entity.entity_id)
+            await asyncio.sleep(ATTRIBUTE_HYDRATION_INTERVAL.total_seconds())
 
 
 class HiveSensorEntity(HiveEntity, SensorEntity):
     """Hive Sensor Entity."""
 
-    def __init__(self, hive, hive_device, entity_description):
+    def __init__(self, hive, hive_device, entity_description, hydrator, local=None):
         """Initialise hive sensor."""
         super().__init__(hive, hive_device)
         self.entity_description = entity_description
+        self.hydrator = hydrator
+        self.local = local
+        self._attributes_hydrated = False
+
+    async def async_added_to_hass(self):
+        """Queue attribute hydration once the core state is published."""
+        await super().async_added_to_hass()
+        if self.device["hiveType"] in ATTRIBUTE_BUILDERS:
+            self.async_on_remove(self.hydrator.async_add(self))
 
     async def async_update(self):
         """Update all Node data from Hive."""
-        await self.hive.session.updateData(self.device)
+        local_state = None
+        if self.local is not None:
+            local_state = await self.local.async_get_state(self.device)
+        # A local read replaces the cloud poll; cached cloud data is still
+        # used for attributes and anything the hub does not expose.
+        if local_state is None:
+            await self.hive.session.updateData(self.device)
         self.device = await self.hive.sensor.getSensor(self.device)
 
-        if self.device["hiveType"] == "CurrentTemperature":
-            self._attr_extra_state_attributes = await self.get_current_temp_sa()
-        elif self.device["hiveType"] == "Heating_State":
-            self._attr_extra_state_attributes = await self.get_heating_state_sa()
-        elif self.device["hiveType"] == "Heating_Mode":
-            self._attr_extra_state_attributes = await self.get_heating_state_sa()
-        elif self.device["hiveType"] == "Heating_Boost":
-            s_a = {}
-            if await self.hive.heating.getBoostStatus(self.device) == "ON":
-                minsend = await self.hive.heating.getBoostTime(self.device)
-                s_a.update({"Boost ends in": (str(minsend) + " minutes")})
-            self._attr_extra_state_attributes = s_a
-        elif self.device["hiveType"] == "Hotwater_State":
-            self._attr_extra_state_attributes = await self.get_hotwater_state_sa()
-        elif self.device["hiveType"] == "Hotwater_Mode":
-            self._attr_extra_state_attributes = await self.get_hotwater_state_sa()
-        elif self.device["hiveType"] == "Hotwater_Boost":
-            s_a = {}
-            if await self.hive.hotwater.getBoost(self.device) == "ON":
-                endsin = await self.hive.hotwater.getBoostTime(self.device)
-                s_a.update({"Boost ends in": (str(endsin) + " minutes")})
-            self._attr_extra_state_attributes = s_a
+        if self._attributes_hydrated:
+            await self.async_update_attributes()
+
+        if local_state is not None:
+            self._attr_available = True
+            self._attr_native_value = local_state
+            return
 
         if self.device["hiveType"] not in ("sense", "Availability"):
             self._attr_available = self.device.get("deviceData", {}).get("online", True)
@@ -148,6 +276,35 @@ class HiveSensorEntity(HiveEntity, SensorEntity):
         if self._attr_available:
             self._attr_native_value = self.device["status"]["state"]
 
+    async def async_hydrate_attributes(self):
+        """Build state attributes deferred from startup and publish them."""
+        # Set first so regular polls retry if this attempt fails.
+        self._attributes_hydrated = True
+        await self.async_update_attributes()
+        self.async_write_ha_state()
+
+    async def async_update_attributes(self):
+        """Update state attributes for the current hive type."""
+        builder = ATTRIBUTE_BUILDERS.get(self.device["hiveType"])
+        if builder is not None:
+            self._attr_extra_state_attributes = await getattr(self, builder)()
+
+    async def get_heating_boost_sa(self):
+        """Get heating boost state attributes."""
+        s_a = {}
+        if await self.hive.heating.getBoostStatus(self.device) == "ON":
+            minsend = await self.hive.heating.getBoostTime(self.device)
+            s_a.update({"Boost ends in": (str(minsend) + " minutes")})
+        return s_a
+
+    async def get_hotwater_boost_sa(self):
+        """Get hotwater boost state attributes."""
+        s_a = {}
+        if await self.hive.hotwater.getBoost(self.device) == "ON":
+            endsin = await self.hive.hotwater.getBoostTime(self.device)
+            s_a.update({"Boost ends in": (str(endsin) + " minutes")})
+        return s_a
+
     async def get_current_temp_sa(self):
         """Get current heating temperature state attributes."""
         s_a = {}
@@ -0,0 +1,76 @@
+"""Tests for the Hive custom component."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from aiohomekit.model import Accessories
+from aiohomekit.testing import FakeController, FakePairing
+
+from custom_components.hive.local import LOCAL_ALIAS
+
+
+def _info(iid: int, name: str) -> dict[str, Any]:
+    """Return a HomeKit accessory information service."""
+    return {
+        "iid": iid,
+        "type": "3E",
+        "characteristics": [_char(iid + 1, "23", "string", name)],
+    }
+
+
+def _char(iid: int, char_type: str, char_format: str, value: Any) -> dict[str, Any]:
+    """Return a readable HomeKit characteristic."""
+    return {
+        "iid": iid,
+        "type": char_type,
+        "format": char_format,
+        "perms": ["pr", "ev"],
+        "value": value,
+    }
+
+
+# A stand-in for the Hive hub's HomeKit bridge: a thermostat, a hot water
+# switch and a plug whose On characteristic must not be read as hot water.
+HUB_HEATING = {
+    "aid": 1,
+    "services": [
+        _info(1, "Heating"),
+        {
+            "iid": 10,
+            "type": "4A",
+            "characteristics": [
+                _char(11, "11", "float", 19.5),
+                _char(12, "35", "float", 21.0),
+                _char(13, "F", "uint8", 0),
+            ],
+        },
+    ],
+}
+HUB_HOT_WATER = {
+    "aid": 2,
+    "services": [
+        _info(1, "Hot Water"),
+        {"iid": 10, "type": "49", "characteristics": [_char(11, "25", "bool", True)]},
+    ],
+}
+HUB_PLUG = {
+    "aid": 3,
+    "services": [
+        _info(1, "Kitchen Plug"),
+        {"iid": 10, "type": "47", "characteristics": [_char(11, "25", "bool", True)]},
+    ],
+}
+HUB_ACCESSORIES = [HUB_HEATING, HUB_HOT_WATER, HUB_PLUG]
+HUB_HOST = "192.168.1.10"
+HUB_PAIRING_DATA = {"AccessoryPairingID": "00:00:00:00:00:00", "AccessoryIP": HUB_HOST}
+HUB_PIN = "111-22-333"
+
+
+async def async_pair_hub(
+    controller: FakeController, accessories: list[dict[str, Any]] = HUB_ACCESSORIES
+) -> FakePairing:
+    """Pair the fake Hive hub with the controller."""
+    return await controller.add_paired_device(
+        Accessories.from_list(accessories), LOCAL_ALIAS
+    )
@@ -0,0 +1,120 @@
+"""Fixtures for the Hive custom component tests."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from copy import copy
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiohomekit.model import Accessories
+from aiohomekit.testing import FakeController
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hive.const import DOMAIN
+
+from . import HUB_ACCESSORIES, HUB_HOST, HUB_PIN
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Enable the custom component in every test."""
+
+
+def _sensor(hive_type: str, state: Any) -> dict[str, Any]:
+    """Return a Hive sensor device."""
+    return {
+        "hiveID": "heating-zone",
+        "hiveName": "Heating",
+        "hiveType": hive_type,
+        "haName": f"Heating {hive_type}",
+        "device_id": "thermostat",
+        "device_name": "Thermostat",
+        "parentDevice": "hub",
+        "deviceData": {
+            "model": "SLR2",
+            "manufacturer": "Hive",
+            "version": "1.0",
+            "online": True,
+        },
+        "status": {"state": state},
+    }
+
+
+@pytest.fixture
+def hive_devices() -> dict[str, list[dict[str, Any]]]:
+    """Return the devices reported by the Hive session."""
+    return {
+        "parent": [
+            {
+                "device_id": "hub",
+                "hiveName": "Hub",
+                "deviceData": {
+                    "model": "HHKBridge",
+                    "version": "1.0",
+                    "manufacturer": "Hive",
+                },
+            }
+        ],
+        "sensor": [
+            _sensor("Heating_State", "ON"),
+            _sensor("Heating_Current_Temperature", 19.5),
+            _sensor("Battery", 90),
+        ],
+    }
+
+
+@pytest.fixture
+def mock_hive(
+    hive_devices: dict[str, list[dict[str, Any]]],
+) -> Generator[MagicMock]:
+    """Patch the Hive API with a mock session."""
+    with patch("custom_components.hive.Hive", autospec=False) as hive_cls:
+        hive = hive_cls.return_value
+        hive.session.startSession = AsyncMock(return_value=hive_devices)
+        hive.session.deviceList = hive_devices
+        hive.session.updateData = AsyncMock(return_value=True)
+        hive.updateInterval = AsyncMock()
+        hive.sensor.getSensor = AsyncMock(side_effect=lambda device: device)
+        hive.heating.minmaxTemperature = AsyncMock(
+            return_value={
+                "TodayMin": 18.0,
+                "TodayMax": 21.0,
+                "RestartMin": 17.5,
+                "RestartMax": 21.5,
+            }
+        )
+        hive.heating.currentTemperature = AsyncMock(return_value=19.5)
+        hive.heating.targetTemperature = AsyncMock(return_value=21.0)
+        hive.heating.getScheduleNowNextLater = AsyncMock(return_value=None)
+        yield hive
+
+
+@pytest.fixture
+def mock_config_entry() -> MockConfigEntry:
+    """Return a Hive config entry."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title="user@example.com",
+        unique_id="user@example.com",
+        data={
+            "username": "user@example.com",
+            "password": "password",
+            "tokens": {"AuthenticationResult": {"AccessToken": "token"}},
+            "device_data": ["group", "key", "password"],
+        },
+    )
+
+
+@pytest.fixture
+def hub_controller(mock_async_zeroconf: MagicMock) -> Generator[FakeController]:
+    """Patch the HomeKit controller with a fake that can find the Hive hub."""
+    controller = FakeController()
+    discovery = controller.add_device(Accessories.from_list(HUB_ACCESSORIES))
+    discovery.pairing_code = HUB_PIN
+    discovery.description = copy(discovery.description)
+    discovery.description.address = HUB_HOST
+    with patch("aiohomekit.Controller", return_value=controller):
+        yield controller
+
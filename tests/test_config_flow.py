@@ -0,0 +1,158 @@
+"""Tests for the Hive config and options flows."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiohomekit.testing import FakeController
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import CONF_HOST, CONF_PIN, CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.hive.const import (
+    CONF_LOCAL_PAIRING,
+    CONF_LOCAL_READ,
+    CONF_LOCAL_UPDATE_PAIRING,
+    DOMAIN,
+)
+
+from . import HUB_HOST, HUB_PAIRING_DATA, async_pair_hub
+
+
+async def test_reauth_keeps_local_pairing(
+    hass: HomeAssistant, mock_hive: MagicMock
+) -> None:
+    """Test reauthenticating with Hive keeps the HomeKit pairing."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="user@example.com",
+        unique_id="user@example.com",
+        data={
+            "username": "user@example.com",
+            "password": "password",
+            "tokens": {"AuthenticationResult": {"AccessToken": "old"}},
+            "device_data": ["group", "key", "password"],
+            CONF_LOCAL_PAIRING: HUB_PAIRING_DATA,
+        },
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    with patch("custom_components.hive.config_flow.Auth") as auth_cls:
+        auth_cls.return_value.login = AsyncMock(
+            return_value={"AuthenticationResult": {"AccessToken": "new"}}
+        )
+        result = await entry.start_reauth_flow(hass)
+        await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reauth_successful"
+    assert entry.data["tokens"]["AuthenticationResult"]["AccessToken"] == "new"
+    assert entry.data["device_data"] == ["group", "key", "password"]
+    assert entry.data[CONF_LOCAL_PAIRING] == HUB_PAIRING_DATA
+
+
+async def _async_start_local_pairing(
+    hass: HomeAssistant, entry: MockConfigEntry, **user_input: Any
+) -> str:
+    """Enable local reads in the options and return the pairing flow id."""
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={CONF_SCAN_INTERVAL: 120, CONF_LOCAL_READ: True, **user_input},
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "local_pairing"
+    return result["flow_id"]
+
+
+@pytest.mark.usefixtures("hub_controller")
+async def test_options_local_pairing(
+    hass: HomeAssistant, mock_hive: MagicMock, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test pairing with the hub saves the pairing and reloads once."""
+    mock_config_entry.add_to_hass(hass)
+    flow_id = await _async_start_local_pairing(hass, mock_config_entry)
+
+    result = await hass.config_entries.options.async_configure(
+        flow_id, user_input={CONF_HOST: HUB_HOST, CONF_PIN: "11122333"}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert mock_config_entry.options[CONF_LOCAL_READ] is True
+    assert CONF_LOCAL_UPDATE_PAIRING not in mock_config_entry.options
+    assert CONF_LOCAL_PAIRING in mock_config_entry.data
+    assert mock_hive.session.startSession.await_count == 2
+    assert mock_config_entry.runtime_data.local is not None
+
+
+@pytest.mark.usefixtures("hub_controller")
+@pytest.mark.parametrize(
+    ("pairing_input", "error"),
+    [
+        ({CONF_PIN: "1234-5678"}, "local_invalid_pin"),
+        ({}, "local_invalid_pin"),
+        ({CONF_PIN: "999-99-999"}, "local_pairing_failed"),
+    ],
+)
+async def test_options_local_pairing_errors(
+    hass: HomeAssistant,
+    mock_hive: MagicMock,
+    mock_config_entry: MockConfigEntry,
+    pairing_input: dict[str, str],
+    error: str,
+) -> None:
+    """Test pairing errors are shown without saving the options."""
+    mock_config_entry.add_to_hass(hass)
+    flow_id = await _async_start_local_pairing(hass, mock_config_entry)
+
+    result = await hass.config_entries.options.async_configure(
+        flow_id, user_input={CONF_HOST: HUB_HOST, **pairing_input}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": error}
+    assert CONF_LOCAL_PAIRING not in mock_config_entry.data
+    assert CONF_LOCAL_READ not in mock_config_entry.options
+    assert mock_hive.session.startSession.await_count == 1
+
+
+async def test_options_update_pairing_host(
+    hass: HomeAssistant,
+    hub_controller: FakeController,
+    mock_hive: MagicMock,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test the hub address can be updated without pairing again."""
+    await async_pair_hub(hub_controller)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=mock_config_entry.title,
+        unique_id=mock_config_entry.unique_id,
+        data={**mock_config_entry.data, CONF_LOCAL_PAIRING: HUB_PAIRING_DATA},
+    )
+    entry.add_to_hass(hass)
+    flow_id = await _async_start_local_pairing(
+        hass, entry, **{CONF_LOCAL_UPDATE_PAIRING: True}
+    )
+
+    result = await hass.config_entries.options.async_configure(
+        flow_id, user_input={CONF_HOST: "192.168.1.20"}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.data[CONF_LOCAL_PAIRING]["AccessoryPairingID"] == "00:00:00:00:00:00"
+    assert entry.data[CONF_LOCAL_PAIRING]["AccessoryIP"] == "192.168.1.20"
+    assert entry.data[CONF_LOCAL_PAIRING]["AccessoryIPs"] == ["192.168.1.20"]
+    assert mock_hive.session.startSession.await_count == 2
@@ -0,0 +1,236 @@
+"""Tests for local Hive hub reads over HomeKit."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiohomekit.testing import FakeController
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.hive.const import CONF_LOCAL_PAIRING, CONF_LOCAL_READ, DOMAIN
+from custom_components.hive.local import (
+    HiveLocalInvalidPin,
+    HiveLocalReader,
+    format_pin,
+)
+
+from . import HUB_HEATING, HUB_PAIRING_DATA, HUB_PLUG, async_pair_hub
+
+
+def _device(hive_type: str, hive_name: str = "Heating") -> dict[str, Any]:
+    """Return a Hive sensor device."""
+    return {"hiveType": hive_type, "hiveName": hive_name}
+
+
+def _local_entry(entry: MockConfigEntry) -> MockConfigEntry:
+    """Return a copy of entry with local reads enabled."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title=entry.title,
+        unique_id=entry.unique_id,
+        data={**entry.data, CONF_LOCAL_PAIRING: HUB_PAIRING_DATA},
+        options={CONF_LOCAL_READ: True},
+    )
+
+
+async def test_local_states(
+    hass: HomeAssistant, hub_controller: FakeController
+) -> None:
+    """Test characteristics are mapped and converted to Hive states."""
+    pairing = await async_pair_hub(hub_controller)
+    reader = HiveLocalReader(hass, HUB_PAIRING_DATA)
+    with patch.object(
+        pairing,
+        "get_characteristics",
+        AsyncMock(wraps=pairing.get_characteristics),
+    ) as get_characteristics:
+        assert (
+            await reader.async_get_state(_device("Heating_Current_Temperature"))
+            == 19.5
+        )
+        assert (
+            await reader.async_get_state(_device("Heating_Target_Temperature"))
+            == 21.0
+        )
+        assert await reader.async_get_state(_device("Heating_State")) == "OFF"
+        assert (
+            await reader.async_get_state(_device("Hotwater_State", "Hot Water"))
+            == "ON"
+        )
+        assert await reader.async_get_state(_device("Battery")) is None
+
+    # All the reads are served by one batched request.
+    assert get_characteristics.await_count == 1
+    await reader.async_stop()
+    assert not hub_controller.started
+
+
+async def test_local_state_requires_matching_service_and_name(
+    hass: HomeAssistant, hub_controller: FakeController
+) -> None:
+    """Test another accessory's characteristic is never used."""
+    # Without the hot water switch the plug is the only On characteristic.
+    await async_pair_hub(hub_controller, [HUB_HEATING, HUB_PLUG])
+    reader = HiveLocalReader(hass, HUB_PAIRING_DATA)
+    assert (
+        await reader.async_get_state(_device("Hotwater_State", "Hot Water")) is None
+    )
+    assert (
+        await reader.async_get_state(_device("Heating_Current_Temperature", "Upstairs"))
+        is None
+    )
+
+
+async def test_local_state_from_service_name(
+    hass: HomeAssistant, hub_controller: FakeController
+) -> None:
+    """Test an accessory without an information service is matched by service."""
+    await async_pair_hub(
+        hub_controller,
+        [
+            {
+                "aid": 1,
+                "services": [
+                    {
+                        "iid": 10,
+                        "type": "49",
+                        "characteristics": [
+                            {
+                                "iid": 11,
+                                "type": "23",
+                                "format": "string",
+                                "perms": ["pr"],
+                                "value": "Hot Water",
+                            },
+                            {
+                                "iid": 12,
+                                "type": "25",
+                                "format": "bool",
+                                "perms": ["pr", "ev"],
+                                "value": False,
+                            },
+                        ],
+                    }
+                ],
+            }
+        ],
+    )
+    reader = HiveLocalReader(hass, HUB_PAIRING_DATA)
+    assert (
+        await reader.async_get_state(_device("Hotwater_State", "Hot Water")) == "OFF"
+    )
+
+
+async def test_local_failure_backs_off(
+    hass: HomeAssistant, hub_controller: FakeController
+) -> None:
+    """Test concurrent reads make one attempt, then use the cloud."""
+    pairing = await async_pair_hub(hub_controller)
+    pairing.available = False
+    reader = HiveLocalReader(hass, HUB_PAIRING_DATA)
+    with patch.object(
+        hub_controller, "load_pairing", wraps=hub_controller.load_pairing
+    ) as load_pairing:
+        states = await asyncio.gather(
+            *(reader.async_get_state(_device("Heating_State")) for _ in range(4))
+        )
+        assert await reader.async_get_state(_device("Heating_State")) is None
+
+    assert states == [None] * 4
+    assert load_pairing.call_count == 1
+    assert not hub_controller.started
+
+
+async def test_local_unexpected_error_backs_off(
+    hass: HomeAssistant, hub_controller: FakeController
+) -> None:
+    """Test any error reading the hub falls back to the cloud."""
+    pairing = await async_pair_hub(hub_controller)
+    reader = HiveLocalReader(hass, HUB_PAIRING_DATA)
+    # An accessory list the model cannot parse.
+    with patch.object(
+        pairing,
+        "list_accessories_and_characteristics",
+        AsyncMock(return_value=[{"aid": 1}]),
+    ) as list_accessories:
+        assert await reader.async_get_state(_device("Heating_State")) is None
+        assert await reader.async_get_state(_device("Heating_State")) is None
+
+    assert list_accessories.await_count == 1
+
+
+@pytest.mark.parametrize(
+    ("pin", "expected"),
+    [
+        ("12345678", "123-45-678"),
+        ("123-45-678", "123-45-678"),
+        (" 123-45678", "123-45-678"),
+    ],
+)
+def test_format_pin(pin: str, expected: str) -> None:
+    """Test HomeKit setup codes are normalised."""
+    assert format_pin(pin) == expected
+
+
+def test_format_pin_invalid() -> None:
+    """Test malformed HomeKit setup codes are rejected."""
+    with pytest.raises(HiveLocalInvalidPin):
+        format_pin("1234-5678")
+
+
+async def test_sensor_falls_back_to_cloud(
+    hass: HomeAssistant,
+    hub_controller: FakeController,
+    mock_hive: MagicMock,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test sensors use the cloud when the hub cannot be reached."""
+    pairing = await async_pair_hub(hub_controller)
+    pairing.available = False
+    entry = _local_entry(mock_config_entry)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = er.async_get(hass).async_get_entity_id(
+        Platform.SENSOR, DOMAIN, "heating-zone-Heating_Current_Temperature"
+    )
+    assert hass.states.get(entity_id).state == "19.5"
+    mock_hive.session.updateData.assert_awaited()
+
+
+async def test_sensor_reads_locally(
+    hass: HomeAssistant,
+    hub_controller: FakeController,
+    mock_hive: MagicMock,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test sensors use the hub value and skip the cloud poll."""
+    await async_pair_hub(hub_controller)
+    entry = _local_entry(mock_config_entry)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.runtime_data.local is not None
+    entity_id = er.async_get(hass).async_get_entity_id(
+        Platform.SENSOR, DOMAIN, "heating-zone-Heating_State"
+    )
+    # The cloud reports ON but the hub reports the heating is off.
+    assert hass.states.get(entity_id).state == "OFF"
+    updated = {
+        call.args[0]["hiveType"]
+        for call in mock_hive.session.updateData.call_args_list
+    }
+    assert "Heating_State" not in updated
+    assert "Heating_Current_Temperature" not in updated
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert not hub_controller.started
@@ -0,0 +1,149 @@
+"""Tests for the Hive profiling services."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from pathlib import Path
+from time import thread_time
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_component import async_update_entity
+from homeassistant.util import dt as dt_util
+
+from custom_components.hive.const import (
+    ATTR_DURATION,
+    DOMAIN,
+    SERVICE_PROFILE_START,
+    SERVICE_PROFILE_STOP,
+)
+from custom_components.hive.sensor import HiveSensorEntity
+
+
+class FakeHotwater:
+    """Stand-in for the Hive library hot water object."""
+
+    async def getBoost(self, device: dict[str, Any]) -> str:  # noqa: N802
+        """Return the hot water boost state."""
+        return "OFF"
+
+
+async def _slow_update(device: dict[str, Any]) -> bool:
+    """Use some CPU, then wait on I/O like a Hive API call."""
+    end = thread_time() + 0.01
+    while thread_time() < end:
+        pass
+    await asyncio.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+async def setup_profiling(
+    hass: HomeAssistant,
+    mock_hive: MagicMock,
+    mock_config_entry: MockConfigEntry,
+    tmp_path: Path,
+) -> None:
+    """Set up Hive with the profile written to tmp_path."""
+    hass.config.config_dir = str(tmp_path)
+    mock_hive.hotwater = FakeHotwater()
+    mock_hive.session.updateData.side_effect = _slow_update
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def _async_call(hass: HomeAssistant, service: str, **data: Any) -> None:
+    """Call a Hive profiling service."""
+    await hass.services.async_call(DOMAIN, service, data, blocking=True)
+
+
+def _profile_rows(tmp_path: Path) -> dict[str, list[float]]:
+    """Return the columns of the single written profile, keyed by name."""
+    (path,) = tmp_path.glob("hive_profile_*.txt")
+    rows = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        columns = line.split()
+        if len(columns) == 7 and columns[0].isdigit():
+            rows[columns[6]] = [float(column) for column in columns[:6]]
+    return rows
+
+
+@pytest.mark.usefixtures("setup_profiling")
+async def test_profile_writes_stats(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test a profile times sensor updates and writes the stats file."""
+    await _async_call(hass, SERVICE_PROFILE_START)
+    entity_id = er.async_get(hass).async_get_entity_id(
+        Platform.SENSOR, DOMAIN, "heating-zone-Heating_State"
+    )
+    await async_update_entity(hass, entity_id)
+    await _async_call(hass, SERVICE_PROFILE_STOP)
+    await hass.async_block_till_done()
+
+    calls, wall, cpu, _, awaiting, _ = _profile_rows(tmp_path)["sensor.async_update"]
+    assert calls == 1
+    assert cpu > 0
+    assert awaiting > 0
+    assert wall >= cpu + awaiting
+
+
+@pytest.mark.usefixtures("setup_profiling")
+async def test_profile_restores_methods(
+    hass: HomeAssistant, mock_hive: MagicMock
+) -> None:
+    """Test the profiled methods are restored exactly once stopped."""
+    async_update = HiveSensorEntity.__dict__["async_update"]
+    hotwater = mock_hive.hotwater
+
+    await _async_call(hass, SERVICE_PROFILE_START)
+    assert HiveSensorEntity.__dict__["async_update"] is not async_update
+    assert "getBoost" in vars(hotwater)
+
+    await _async_call(hass, SERVICE_PROFILE_STOP)
+    assert HiveSensorEntity.__dict__["async_update"] is async_update
+    assert "getBoost" not in vars(hotwater)
+    assert await hotwater.getBoost({}) == "OFF"
+
+
+@pytest.mark.usefixtures("setup_profiling")
+async def test_profile_start_while_running(hass: HomeAssistant) -> None:
+    """Test a second profile cannot be started while one is running."""
+    await _async_call(hass, SERVICE_PROFILE_START)
+    with pytest.raises(HomeAssistantError):
+        await _async_call(hass, SERVICE_PROFILE_START)
+    await _async_call(hass, SERVICE_PROFILE_STOP)
+
+
+@pytest.mark.usefixtures("setup_profiling")
+async def test_profile_stop_without_profile(hass: HomeAssistant) -> None:
+    """Test stopping fails when no profile is running."""
+    with pytest.raises(HomeAssistantError):
+        await _async_call(hass, SERVICE_PROFILE_STOP)
+
+
+@pytest.mark.usefixtures("setup_profiling")
+async def test_profile_stops_after_duration(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test the profile stops and is written once its duration has elapsed."""
+    async_update = HiveSensorEntity.__dict__["async_update"]
+    await _async_call(hass, SERVICE_PROFILE_START, **{ATTR_DURATION: 5})
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+
+    assert list(tmp_path.glob("hive_profile_*.txt"))
+    assert HiveSensorEntity.__dict__["async_update"] is async_update
+    with pytest.raises(HomeAssistantError):
+        await _async_call(hass, SERVICE_PROFILE_STOP)
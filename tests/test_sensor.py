@@ -0,0 +1,224 @@
+"""Tests for the Hive sensors."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from homeassistant.const import (
+    CONF_SCAN_INTERVAL,
+    EVENT_HOMEASSISTANT_STARTED,
+    Platform,
+)
+from homeassistant.core import CoreState, HomeAssistant, State
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from custom_components.hive.const import (
+    CONF_EXCLUDED_SENSOR_TYPES,
+    CONF_SENSOR_TYPES,
+    DOMAIN,
+)
+from custom_components.hive.sensor import (
+    ATTRIBUTE_HYDRATION_INTERVAL,
+    SENSOR_HIVE_TYPES,
+)
+
+
+def _state(hass: HomeAssistant, unique_id: str) -> State:
+    """Return the state of the Hive sensor with unique_id."""
+    entity_id = er.async_get(hass).async_get_entity_id(
+        Platform.SENSOR, DOMAIN, unique_id
+    )
+    assert entity_id is not None
+    state = hass.states.get(entity_id)
+    assert state is not None
+    return state
+
+
+async def test_attributes_deferred_until_started(
+    hass: HomeAssistant, mock_hive: MagicMock, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test attributes are built after start, one entity per interval."""
+    hass.set_state(CoreState.not_running)
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert _state(hass, "heating-zone-Heating_State").state == "ON"
+    mock_hive.heating.getScheduleNowNextLater.assert_not_awaited()
+    mock_hive.heating.minmaxTemperature.assert_not_awaited()
+
+    hass.set_state(CoreState.running)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+    # Only the first queued entity is built until the interval has passed.
+    mock_hive.heating.getScheduleNowNextLater.assert_awaited_once()
+    mock_hive.heating.minmaxTemperature.assert_not_awaited()
+    assert (
+        _state(hass, "heating-zone-Heating_State").attributes["Schedule not active"]
+        == ""
+    )
+
+    async_fire_time_changed(hass, dt_util.utcnow() + ATTRIBUTE_HYDRATION_INTERVAL)
+    await hass.async_block_till_done()
+
+    mock_hive.heating.minmaxTemperature.assert_awaited_once()
+    state = _state(hass, "heating-zone-Heating_Current_Temperature")
+    assert state.attributes["Today Min / Max"] == "18.0 °C / 21.0 °C"
+
+    async_fire_time_changed(hass, dt_util.utcnow() + ATTRIBUTE_HYDRATION_INTERVAL)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+
+async def test_attributes_hydrated_after_reload(
+    hass: HomeAssistant, mock_hive: MagicMock, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test attributes are built when the entry is reloaded after start."""
+    mock_config_entry.add_to_hass(hass)
+    with patch(
+        "custom_components.hive.sensor.ATTRIBUTE_HYDRATION_INTERVAL", timedelta(0)
+    ):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        assert await hass.config_entries.async_reload(mock_config_entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    state = _state(hass, "heating-zone-Heating_State")
+    assert state.state == "ON"
+    assert state.attributes["Schedule not active"] == ""
+
+    state = _state(hass, "heating-zone-Heating_Current_Temperature")
+    assert state.state == "19.5"
+    assert state.attributes["Today Min / Max"] == "18.0 °C / 21.0 °C"
+    assert state.attributes["Restart Min / Max"] == "17.5 °C / 21.5 °C"
+    assert state.attributes["Temperature Difference"] == 1.5
+
+
+async def test_attribute_error_does_not_stop_hydration(
+    hass: HomeAssistant, mock_hive: MagicMock, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test a failing entity does not stop later entities being hydrated."""
+    mock_hive.heating.getScheduleNowNextLater.side_effect = ValueError
+    mock_config_entry.add_to_hass(hass)
+    with patch(
+        "custom_components.hive.sensor.ATTRIBUTE_HYDRATION_INTERVAL", timedelta(0)
+    ):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    state = _state(hass, "heating-zone-Heating_State")
+    assert state.state == "ON"
+    assert "Schedule not active" not in state.attributes
+
+    state = _state(hass, "heating-zone-Heating_Current_Temperature")
+    assert state.attributes["Temperature Difference"] == 1.5
+
+
+async def test_diagnostic_sensors_disabled_without_updates(
+    hass: HomeAssistant, mock_hive: MagicMock, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test disabled diagnostic sensors are registered but never fetched."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_registry = er.async_get(hass)
+    entity_id = entity_registry.async_get_entity_id(
+        Platform.SENSOR, DOMAIN, "heating-zone-Battery"
+    )
+    assert entity_id is not None
+    assert entity_registry.async_get(entity_id).disabled
+    assert hass.states.get(entity_id) is None
+    assert all(
+        call.args[0]["hiveType"] != "Battery"
+        for call in mock_hive.sensor.getSensor.call_args_list
+    )
+
+
+async def test_new_entities_disabled_by_preference(
+    hass: HomeAssistant,
+    mock_hive: MagicMock,
+    hive_devices: dict[str, list[dict[str, Any]]],
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test entities disabled by the entry preference are never fetched."""
+    mock_config_entry.pref_disable_new_entities = True
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_registry = er.async_get(hass)
+    for device in hive_devices["sensor"]:
+        entity_id = entity_registry.async_get_entity_id(
+            Platform.SENSOR, DOMAIN, f"heating-zone-{device['hiveType']}"
+        )
+        assert entity_registry.async_get(entity_id).disabled
+    mock_hive.sensor.getSensor.assert_not_awaited()
+    mock_hive.session.updateData.assert_not_awaited()
+
+
+async def _async_save_options(
+    hass: HomeAssistant, entry: MockConfigEntry, user_input: dict[str, Any]
+) -> None:
+    """Submit the options form with user_input."""
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input=user_input
+    )
+    await hass.async_block_till_done()
+
+
+async def test_options_keep_new_sensor_types(
+    hass: HomeAssistant, mock_hive: MagicMock, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test saving unrelated options does not exclude any sensor types."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    await _async_save_options(hass, mock_config_entry, {CONF_SCAN_INTERVAL: 60})
+
+    assert mock_config_entry.options[CONF_EXCLUDED_SENSOR_TYPES] == []
+    assert CONF_SENSOR_TYPES not in mock_config_entry.options
+
+
+async def test_deselected_sensor_types_removed(
+    hass: HomeAssistant, mock_hive: MagicMock, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test registry entries are removed for sensor types not selected."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_registry = er.async_get(hass)
+    assert entity_registry.async_get_entity_id(
+        Platform.SENSOR, DOMAIN, "heating-zone-Heating_State"
+    )
+
+    await _async_save_options(
+        hass,
+        mock_config_entry,
+        {
+            CONF_SCAN_INTERVAL: 120,
+            CONF_SENSOR_TYPES: [
+                key for key in SENSOR_HIVE_TYPES if key != "Heating_State"
+            ],
+        },
+    )
+
+    assert mock_config_entry.options[CONF_EXCLUDED_SENSOR_TYPES] == ["Heating_State"]
+    assert not entity_registry.async_get_entity_id(
+        Platform.SENSOR, DOMAIN, "heating-zone-Heating_State"
+    )
+    assert entity_registry.async_get_entity_id(
+        Platform.SENSOR, DOMAIN, "heating-zone-Heating_Current_Temperature"
+    )